@@ -7,16 +7,50 @@ The script mirrors the computations from 04_insight_validation.ipynb:
 - write Markdown + JSON + CSV summaries into data/derived/04_insight_validation.
 Run it from anywhere inside the repo:
     python notebooks/export_insight_validation_artifacts.py
+
+Pass ``--streaming`` to write records incrementally into ``streaming/`` instead:
+insight records go to JSON Lines shards under ``insights/``, regime and pair
+stats are appended as Parquet row groups (one per shard), and
+``insight_manifest.json`` maps each insight ID to its shard, byte offset, length
+and row groups (see ``read_insight``).
+
+Pass ``--generate`` to replace the hand-written ``CANDIDATE_INSIGHTS`` with an
+automated sweep over every KPI x regime pair x segment slice; only the top-k
+candidates by the lower confidence bound of their effect size (``--top-k``) are
+charted (into ``figures/generated/``) and exported.
 """
 
 from __future__ import annotations
 
+import argparse
+import heapq
 import json
+import shutil
+import tempfile
+import time
+from itertools import combinations
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from scipy import stats
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
 plt.style.use("seaborn-v0_8")
 
@@ -27,6 +61,18 @@ REGIME_COLORS: Dict[str, str] = {
     "2020-2022": "#fce5cd",
     "2023-2025": "#d9d2e9",
 }
+REGIME_PAIRS: List[Tuple[str, str]] = list(combinations(REGIME_ORDER, 2))
+
+# Streaming export layout
+STREAMING_SUBDIR = "streaming"
+SHARD_PREFIX = "insights"
+DEFAULT_RECORDS_PER_SHARD = 1000
+
+# Automated candidate generation defaults
+DEFAULT_TOP_K = 10
+DEFAULT_TIME_BUDGET_S = 30.0
+DEFAULT_ALPHA = 0.05
+DEFAULT_MIN_N = 6
 
 # Candidate insights to validate and export
 CANDIDATE_INSIGHTS: List[Dict[str, object]] = [
@@ -126,10 +172,29 @@ def regime_windows(df: pd.DataFrame) -> List[Dict[str, object]]:
     ]
 
 
-def plot_series(df: pd.DataFrame, kpi: str, title: str, fig_path: Path) -> Path:
-    """Plot KPI over time with shaded regimes and save as PNG."""
+def plot_series(
+    df: pd.DataFrame,
+    kpi: str,
+    title: str,
+    fig_path: Path,
+    highlight: Optional[pd.DataFrame] = None,
+    highlight_label: str = "segment",
+) -> Path:
+    """Plot KPI over time with shaded regimes and save as PNG.
+
+    ``highlight`` marks the rows of a segment slice on top of the full series.
+    """
     fig, ax = plt.subplots(figsize=(9, 4))
     ax.plot(df["date"], df[kpi], color="#1f77b4", linewidth=1.5)
+    if highlight is not None:
+        ax.scatter(
+            highlight["date"],
+            highlight[kpi],
+            color="#d62728",
+            s=18,
+            zorder=3,
+            label=highlight_label,
+        )
     ax.set_title(title)
     ax.set_ylabel(kpi)
     ax.set_xlabel("date")
@@ -143,7 +208,7 @@ def plot_series(df: pd.DataFrame, kpi: str, title: str, fig_path: Path) -> Path:
         )
     handles, labels = ax.get_legend_handles_labels()
     by_label = dict(zip(labels, handles))
-    ax.legend(by_label.values(), by_label.keys(), title="regime")
+    ax.legend(by_label.values(), by_label.keys(), title="regime" if highlight is None else None)
     ax.grid(True, linestyle="--", alpha=0.4)
     fig.tight_layout()
     fig.savefig(fig_path, dpi=160, bbox_inches="tight")
@@ -195,13 +260,287 @@ def candidate_stats(
     return regime_rows, pair_rows
 
 
-def build_markdown(
-    export_dir: Path,
-    data_path: Path,
-    windows: List[Dict[str, object]],
-    insights: List[Dict[str, object]],
-) -> str:
-    """Construct a Markdown summary that is easy for LLMs to parse."""
+def label_all(df: pd.DataFrame) -> pd.Series:
+    return pd.Series("all", index=df.index)
+
+
+def label_half(df: pd.DataFrame) -> pd.Series:
+    return pd.Series(np.where(df["date"].dt.month <= 6, "H1", "H2"), index=df.index)
+
+
+def label_quarter(df: pd.DataFrame) -> pd.Series:
+    return "Q" + df["date"].dt.quarter.astype(str)
+
+
+def label_bdi_level(df: pd.DataFrame) -> pd.Series:
+    """Split months into high/low freight cost around their own regime's BDI median.
+
+    A full-sample median would largely reproduce the 2020-2022 regime (freight
+    rates spiked then), so the slice would just re-measure the regime effect.
+    Splitting within each regime keeps both slices populated in every regime.
+    """
+    regime_median = df.groupby("regime", observed=False)["bdi_price"].transform("median")
+    labels = pd.Series("low", index=df.index)
+    labels[df["bdi_price"] > regime_median] = "high"
+    labels[df["bdi_price"].isna()] = "missing"
+    return labels
+
+
+# Segment dimensions swept by the candidate generator; regime pairs are compared
+# within every slice of each dimension.
+SEGMENT_DIMENSIONS: Dict[str, Callable[[pd.DataFrame], pd.Series]] = {
+    "all": label_all,
+    "half": label_half,
+    "quarter": label_quarter,
+    "bdi_level": label_bdi_level,
+}
+
+# Columns a segment dimension is derived from; they are not swept as KPIs within
+# that dimension, since slicing a KPI by its own level is tautological.
+SEGMENT_SOURCE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "bdi_level": ("bdi_price",),
+}
+
+
+def segment_frame(df: pd.DataFrame, segment: Optional[Dict[str, str]]) -> pd.DataFrame:
+    """Return the rows of ``df`` that fall inside a candidate's segment slice."""
+    if not segment:
+        return df
+    labels = SEGMENT_DIMENSIONS[segment["dimension"]](df)
+    return df[labels == segment["value"]]
+
+
+def kpi_columns(df: pd.DataFrame) -> List[str]:
+    """Numeric KPI columns of the clean panel (boolean QA flags are excluded)."""
+    return list(df.select_dtypes(include="number").columns)
+
+
+def relevance_from_effect(effect: float) -> int:
+    """Bucket an absolute standardized effect into the 1-5 relevance scale."""
+    for threshold, score in ((1.5, 5), (1.0, 4), (0.5, 3), (0.2, 2)):
+        if effect >= threshold:
+            return score
+    return 1
+
+
+def welch_df(
+    var_a: np.ndarray, n_a: np.ndarray, var_b: np.ndarray, n_b: np.ndarray
+) -> np.ndarray:
+    """Welch-Satterthwaite degrees of freedom, elementwise."""
+    se_a, se_b = var_a / n_a, var_b / n_b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (se_a + se_b) ** 2 / (se_a**2 / (n_a - 1) + se_b**2 / (n_b - 1))
+
+
+def generate_candidate_insights(
+    df: pd.DataFrame,
+    top_k: int = DEFAULT_TOP_K,
+    time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+    alpha: float = DEFAULT_ALPHA,
+    min_n: int = DEFAULT_MIN_N,
+) -> Tuple[List[Dict[str, object]], Dict[str, object]]:
+    """Sweep KPI x regime pair x segment slice and keep the top-k candidates.
+
+    Each candidate is a Welch test of one regime pair for one KPI within one
+    segment slice. It is scored by the lower confidence bound of its regime-mean
+    delta, standardized by the KPI's full-panel standard deviation. The bound
+    uses the Welch-Satterthwaite df and a Bonferroni-adjusted critical value
+    over every test in the sweep, so small, noisy slices are shrunk towards zero
+    and only candidates significant after correction (bound > 0) are kept.
+    Bonferroni rather than Holm/BH: pruned tests never get a p-value, and it
+    only needs the family size, which is known up front.
+
+    Only the best-scoring slice of each (KPI, regime pair) is kept, and a
+    sub-slice only qualifies when its lower bound exceeds the full-sample point
+    effect, i.e. when the effect is credibly larger inside the slice rather than
+    the luckiest cut of the same effect.
+
+    Regime counts and means come from one grouped pass per segment dimension.
+    The spread of regime means bounds every pair's score, so variances and pair
+    stats are only computed for slices and KPIs whose bound can still beat the
+    current k-th best. Both stages stop once ``time_budget_s`` is spent.
+
+    Returns the candidates (best first) and a dict of sweep statistics.
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
+    if not 0 < alpha < 1:
+        raise ValueError("alpha must be between 0 and 1")
+    started = time.monotonic()
+    kpis = kpi_columns(df)
+    panel_sd = df[kpis].std().replace(0, np.nan)
+    regime_idx = {reg: pos for pos, reg in enumerate(REGIME_ORDER)}
+    budget_exhausted = False
+
+    def out_of_time() -> bool:
+        return time.monotonic() - started > time_budget_s
+
+    # Label every dimension first so the Bonferroni family size is known.
+    dimension_labels: Dict[str, pd.Series] = {}
+    swept_kpis: Dict[str, np.ndarray] = {}
+    n_tests = 0
+    for dimension, labeller in SEGMENT_DIMENSIONS.items():
+        labels = labeller(df).rename("segment_value")
+        excluded = SEGMENT_SOURCE_COLUMNS.get(dimension, ())
+        swept = np.array([kpi not in excluded for kpi in kpis])
+        dimension_labels[dimension] = labels
+        swept_kpis[dimension] = swept
+        n_tests += labels.nunique() * len(REGIME_PAIRS) * int(swept.sum())
+    tail = alpha / (2 * n_tests)
+
+    # Stage 1: counts/means for every slice of a dimension in one grouped pass,
+    # then the score upper bound per KPI.
+    slices: List[Dict[str, object]] = []
+    for dimension, labels in dimension_labels.items():
+        if out_of_time():
+            budget_exhausted = True
+            break
+        grouped = df.groupby([labels, "regime"], observed=False)[kpis]
+        all_counts, all_means = grouped.count(), grouped.mean()
+        for value in sorted(labels.unique()):
+            counts = all_counts.xs(value, level=0).reindex(REGIME_ORDER)
+            means = all_means.xs(value, level=0).reindex(REGIME_ORDER)
+            valid_means = means.where(counts >= min_n)
+            bound = ((valid_means.max() - valid_means.min()) / panel_sd).fillna(0.0)
+            bound = bound.to_numpy(dtype=float) * swept_kpis[dimension]
+            if bound.max() <= 0:
+                continue
+            slices.append(
+                {
+                    "segment": {"dimension": dimension, "value": str(value)},
+                    "mask": (labels == value).to_numpy(),
+                    "counts": counts.to_numpy(dtype=float),
+                    "means": means.to_numpy(dtype=float),
+                    "bound": bound,
+                }
+            )
+    # The full sample goes first: it sets the baseline sub-slices must beat.
+    slices.sort(
+        key=lambda item: (item["segment"]["dimension"] == "all", float(item["bound"].max())),
+        reverse=True,
+    )
+
+    # Stage 2: variances and vectorized Welch tests for KPIs that can still
+    # enter the heap. Heap entries are unique per (kpi, base, compare).
+    heap: List[Tuple[float, int, Tuple[str, str, str], Dict[str, object]]] = []
+    pushed = 0
+    evaluated = 0
+    sd = panel_sd.to_numpy(dtype=float)
+    baseline = np.zeros((len(REGIME_PAIRS), len(kpis)))
+    for item in slices:
+        if budget_exhausted or out_of_time():
+            budget_exhausted = True
+            break
+        threshold = heap[0][0] if len(heap) >= top_k else 0.0
+        live = np.flatnonzero(item["bound"] > threshold)
+        is_baseline = item["segment"]["dimension"] == "all"
+        if live.size == 0:
+            if is_baseline:
+                continue
+            # Slices are sorted by bound, so none of the remaining ones can qualify.
+            break
+        evaluated += 1
+        live_kpis = [kpis[pos] for pos in live]
+        variances = (
+            df.loc[item["mask"]]
+            .groupby("regime", observed=False)[live_kpis]
+            .var()
+            .reindex(REGIME_ORDER)
+            .to_numpy(dtype=float)
+        )
+        counts, means = item["counts"][:, live], item["means"][:, live]
+        for pair_pos, (base_reg, compare_reg) in enumerate(REGIME_PAIRS):
+            a, b = regime_idx[base_reg], regime_idx[compare_reg]
+            n_a, n_b = counts[a], counts[b]
+            delta = means[b] - means[a]
+            dof = welch_df(variances[a], n_a, variances[b], n_b)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                se = np.sqrt(variances[a] / n_a + variances[b] / n_b)
+                t_stat = delta / se
+                effect = np.abs(delta) / sd[live]
+                lower = (np.abs(delta) - stats.t.isf(tail, dof) * se) / sd[live]
+            keep = (n_a >= min_n) & (n_b >= min_n) & (lower > threshold)
+            if is_baseline:
+                baseline[pair_pos, live] = np.nan_to_num(effect)
+            else:
+                keep &= lower > baseline[pair_pos, live]
+            for pos in np.flatnonzero(keep):
+                score = float(lower[pos])
+                if len(heap) >= top_k and score <= heap[0][0]:
+                    continue
+                kpi = live_kpis[pos]
+                key = (kpi, base_reg, compare_reg)
+                p_value = float(2 * stats.t.sf(abs(t_stat[pos]), dof[pos]))
+                payload = {
+                    "kpi": kpi,
+                    "segment": item["segment"],
+                    "pairs": [(base_reg, compare_reg)],
+                    "score": {
+                        "effect_size": round(float(effect[pos]), 3),
+                        "effect_lower_bound": round(score, 3),
+                        "delta_mean": round(float(delta[pos]), 2),
+                        "t_stat": round(float(t_stat[pos]), 2),
+                        "welch_df": round(float(dof[pos]), 1),
+                        "p_value": p_value,
+                        "p_value_bonferroni": min(1.0, p_value * n_tests),
+                    },
+                    "direction": "higher" if delta[pos] > 0 else "lower",
+                }
+                entry = (score, pushed, key, payload)
+                pushed += 1
+                existing = next(
+                    (idx for idx, held in enumerate(heap) if held[2] == key), None
+                )
+                if existing is not None:
+                    if score > heap[existing][0]:
+                        heap[existing] = entry
+                        heapq.heapify(heap)
+                elif len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+                threshold = heap[0][0] if len(heap) >= top_k else 0.0
+
+    sweep = {
+        "kpis": len(kpis),
+        "regime_pairs": len(REGIME_PAIRS),
+        "tests": n_tests,
+        "slices": len(slices),
+        "slices_evaluated": evaluated,
+        "kept": len(heap),
+        "elapsed_s": round(time.monotonic() - started, 3),
+        "budget_exhausted": budget_exhausted,
+    }
+
+    candidates: List[Dict[str, object]] = []
+    for rank, (score, _, _, payload) in enumerate(sorted(heap, reverse=True), start=1):
+        base_reg, compare_reg = payload["pairs"][0]
+        segment = payload["segment"]
+        scope = (
+            "" if segment["dimension"] == "all"
+            else f" ({segment['dimension']}={segment['value']})"
+        )
+        candidates.append(
+            {
+                "id": f"GI{rank:03d}",
+                "title": (
+                    f"{payload['kpi']} {payload['direction']} in {compare_reg} "
+                    f"vs {base_reg}{scope}"
+                ),
+                "kpi": payload["kpi"],
+                "relevance_score": relevance_from_effect(score),
+                "pairs": payload["pairs"],
+                "segment": segment,
+                "score": payload["score"],
+            }
+        )
+    return candidates, sweep
+
+
+def markdown_header(
+    export_dir: Path, data_path: Path, windows: List[Dict[str, object]]
+) -> List[str]:
+    """Return the Markdown preamble listing source data, figures and regime windows."""
     lines: List[str] = []
     lines.append("# Insight validation export")
     data_root = export_dir.parent.parent
@@ -213,62 +552,235 @@ def build_markdown(
     )
     lines.append(f"- regime_windows: {window_text}")
     lines.append("")
-    for insight in insights:
-        lines.append(f"## {insight['id']} - {insight['title']}")
+    return lines
+
+
+def markdown_insight_section(insight: Dict[str, object]) -> List[str]:
+    """Return the Markdown lines describing a single insight record."""
+    lines: List[str] = []
+    lines.append(f"## {insight['id']} - {insight['title']}")
+    lines.append(
+        f"- kpi: `{insight['kpi']}` (relevance_score={insight['relevance_score']})"
+    )
+    lines.append(f"- figure: `{insight['figure']}`")
+    if "segment" in insight:
+        segment = insight["segment"]
+        lines.append(f"- segment: {segment['dimension']}={segment['value']}")
+    if "score" in insight:
+        score = insight["score"]
         lines.append(
-            f"- kpi: `{insight['kpi']}` (relevance_score={insight['relevance_score']})"
+            f"- score: effect_size={score['effect_size']}, "
+            f"effect_lower_bound={score['effect_lower_bound']}, t_stat={score['t_stat']}, "
+            f"welch_df={score['welch_df']}, p_value={score['p_value']:.2g}, "
+            f"p_value_bonferroni={score['p_value_bonferroni']:.2g}"
         )
-        lines.append(f"- figure: `{insight['figure']}`")
-        sample_sizes = "; ".join(
-            f"{r['regime']}: n={r['n_valid']}, missing={r['n_missing']}"
-            for r in insight["regime_stats"]
+    sample_sizes = "; ".join(
+        f"{r['regime']}: n={r['n_valid']}, missing={r['n_missing']}"
+        for r in insight["regime_stats"]
+    )
+    lines.append(f"- sample_sizes: {sample_sizes}")
+    for pair in insight["pair_deltas"]:
+        lines.append(
+            f"- delta {pair['compare_regime']} vs {pair['base_regime']}: "
+            f"delta_mean={pair['delta_mean']}, ratio_mean={pair['ratio_mean']}"
         )
-        lines.append(f"- sample_sizes: {sample_sizes}")
-        for pair in insight["pair_deltas"]:
-            lines.append(
-                f"- delta {pair['compare_regime']} vs {pair['base_regime']}: "
-                f"delta_mean={pair['delta_mean']}, ratio_mean={pair['ratio_mean']}"
-            )
-        lines.append(f"- conclusion: {insight['title']}")
-        lines.append("")
-    return "\n".join(lines)
+    lines.append(f"- conclusion: {insight['title']}")
+    lines.append("")
+    return lines
 
 
-def main() -> None:
-    start_dir = Path(__file__).resolve().parent if "__file__" in globals() else Path.cwd()
-    data_path = locate_data_clean(start_dir)
-    df = load_frame(data_path)
-    export_dir, fig_dir = ensure_output_dirs(data_path)
+def build_markdown(
+    export_dir: Path,
+    data_path: Path,
+    windows: List[Dict[str, object]],
+    insights: List[Dict[str, object]],
+) -> str:
+    """Construct a Markdown summary that is easy for LLMs to parse."""
+    lines = markdown_header(export_dir, data_path, windows)
+    for insight in insights:
+        lines.extend(markdown_insight_section(insight))
+    return "\n".join(lines)
 
-    windows = regime_windows(df)
-    insight_records: List[Dict[str, object]] = []
-    all_regime_rows: List[Dict[str, object]] = []
-    all_pair_rows: List[Dict[str, object]] = []
 
-    for insight in CANDIDATE_INSIGHTS:
+def iter_insight_records(
+    df: pd.DataFrame,
+    candidates: Iterable[Dict[str, object]],
+    export_dir: Path,
+    fig_dir: Path,
+) -> Iterator[Tuple[Dict[str, object], List[Dict[str, object]], List[Dict[str, object]]]]:
+    """Render each candidate's chart and yield its record plus tagged stat rows."""
+    for insight in candidates:
         kpi = str(insight["kpi"])
         figure_path = fig_dir / f"{insight['id'].lower()}_{kpi}.png"
-        plot_series(df, kpi, str(insight["title"]), figure_path)
+        segment = insight.get("segment")
+        frame = segment_frame(df, segment)
+        plot_series(
+            df,
+            kpi,
+            str(insight["title"]),
+            figure_path,
+            highlight=frame if segment else None,
+            highlight_label=(
+                f"{segment['dimension']}={segment['value']}" if segment else "segment"
+            ),
+        )
 
-        regime_rows, pair_rows = candidate_stats(df, kpi, insight["pairs"])
-        all_regime_rows.extend(
+        regime_rows, pair_rows = candidate_stats(frame, kpi, insight["pairs"])
+        tagged_regime_rows = [
             {**row, "insight_id": insight["id"], "kpi": kpi} for row in regime_rows
-        )
-        all_pair_rows.extend(
+        ]
+        tagged_pair_rows = [
             {**row, "insight_id": insight["id"], "kpi": kpi} for row in pair_rows
-        )
+        ]
+        record = {
+            "id": insight["id"],
+            "title": insight["title"],
+            "kpi": kpi,
+            "relevance_score": insight["relevance_score"],
+            "figure": str(figure_path.relative_to(export_dir.parent.parent).as_posix()),
+            "regime_stats": regime_rows,
+            "pair_deltas": pair_rows,
+        }
+        for key in ("segment", "score"):
+            if key in insight:
+                record[key] = insight[key]
+        yield record, tagged_regime_rows, tagged_pair_rows
+
+
+class InsightShardWriter:
+    """Append insight records to JSON Lines shards and index where each one lands.
+
+    Every record is serialised to a single line; the manifest entry keeps the
+    shard path (relative to ``anchor``), byte offset and byte length so a
+    consumer can ``seek`` straight to one insight without parsing the shard.
+    """
+
+    def __init__(self, shard_dir: Path, anchor: Path, records_per_shard: int) -> None:
+        if records_per_shard < 1:
+            raise ValueError("records_per_shard must be at least 1")
+        self.shard_dir = shard_dir
+        self.anchor = anchor
+        self.records_per_shard = records_per_shard
+        self.shards: List[str] = []
+        self.index: Dict[str, Dict[str, object]] = {}
+        self._handle: Optional[BinaryIO] = None
+        self._shard_rel = ""
+        self._lines_in_shard = 0
+        shard_dir.mkdir(parents=True, exist_ok=True)
+
+    def _open_next_shard(self) -> None:
+        self.close()
+        shard_path = self.shard_dir / f"{SHARD_PREFIX}-{len(self.shards):05d}.jsonl"
+        self._handle = shard_path.open("wb")
+        self._shard_rel = as_relative_posix(shard_path, self.anchor)
+        self._lines_in_shard = 0
+        self.shards.append(self._shard_rel)
+
+    @property
+    def shard_index(self) -> int:
+        """Index of the shard the next record will be written to."""
+        if self._handle is None or self._lines_in_shard >= self.records_per_shard:
+            return len(self.shards)
+        return len(self.shards) - 1
+
+    def write(self, record: Dict[str, object]) -> Dict[str, object]:
+        insight_id = str(record["id"])
+        if insight_id in self.index:
+            raise ValueError(f"Duplicate insight id in export: {insight_id}")
+        if self._handle is None or self._lines_in_shard >= self.records_per_shard:
+            self._open_next_shard()
+        payload = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        offset = self._handle.tell()
+        self._handle.write(payload)
+        entry: Dict[str, object] = {
+            "shard": self._shard_rel,
+            "line": self._lines_in_shard,
+            "offset": offset,
+            "length": len(payload),
+            "kpi": record["kpi"],
+            "title": record["title"],
+        }
+        self.index[insight_id] = entry
+        self._lines_in_shard += 1
+        return entry
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self) -> "InsightShardWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class RowGroupBuffer:
+    """Buffer stat rows and write them to Parquet as one row group per flush.
+
+    Flushing once per JSONL shard keeps row groups large enough that the
+    Parquet footer stays small even for tens of thousands of insights.
+    """
+
+    def __init__(
+        self,
+        writer: "pq.ParquetWriter",
+        make_table: Callable[[List[Dict[str, object]]], "pa.Table"],
+    ) -> None:
+        self.writer = writer
+        self.make_table = make_table
+        self.row_groups = 0
+        self._rows: List[Dict[str, object]] = []
+
+    def add(self, rows: List[Dict[str, object]]) -> Optional[int]:
+        """Queue rows and return the row group they will land in (None if empty)."""
+        if not rows:
+            return None
+        self._rows.extend(rows)
+        return self.row_groups
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        self.writer.write_table(self.make_table(self._rows), row_group_size=len(self._rows))
+        self._rows = []
+        self.row_groups += 1
+
+
+def read_insight(manifest_path: Path, insight_id: str) -> Dict[str, object]:
+    """Fetch a single insight record from a streaming export via its manifest."""
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    try:
+        entry = manifest["insights"][insight_id]
+    except KeyError as exc:
+        raise KeyError(f"Insight {insight_id!r} not found in {manifest_path}") from exc
+    shard_path = manifest_path.parent / entry["shard"]
+    with shard_path.open("rb") as handle:
+        handle.seek(int(entry["offset"]))
+        payload = handle.read(int(entry["length"]))
+    return json.loads(payload.decode("utf-8"))
+
+
+def export_batch(
+    df: pd.DataFrame,
+    data_path: Path,
+    export_dir: Path,
+    fig_dir: Path,
+    candidates: Iterable[Dict[str, object]] = CANDIDATE_INSIGHTS,
+) -> None:
+    """Write the monolithic Markdown, JSON and CSV summaries."""
+    windows = regime_windows(df)
+    insight_records: List[Dict[str, object]] = []
+    all_regime_rows: List[Dict[str, object]] = []
+    all_pair_rows: List[Dict[str, object]] = []
 
-        insight_records.append(
-            {
-                "id": insight["id"],
-                "title": insight["title"],
-                "kpi": kpi,
-                "relevance_score": insight["relevance_score"],
-                "figure": str(figure_path.relative_to(export_dir.parent.parent).as_posix()),
-                "regime_stats": regime_rows,
-                "pair_deltas": pair_rows,
-            }
-        )
+    for record, regime_rows, pair_rows in iter_insight_records(
+        df, candidates, export_dir, fig_dir
+    ):
+        insight_records.append(record)
+        all_regime_rows.extend(regime_rows)
+        all_pair_rows.extend(pair_rows)
 
     markdown_body = build_markdown(export_dir, data_path, windows, insight_records)
     (export_dir / "insight_validation_summary.md").write_text(markdown_body, encoding="utf-8")
@@ -292,7 +804,211 @@ def main() -> None:
             export_dir / "insight_pair_deltas.csv", index=False
         )
 
-    print(f"Saved LLM-ready artifacts to {export_dir}")
+
+def export_streaming(
+    df: pd.DataFrame,
+    data_path: Path,
+    export_dir: Path,
+    fig_dir: Path,
+    records_per_shard: int = DEFAULT_RECORDS_PER_SHARD,
+    candidates: Iterable[Dict[str, object]] = CANDIDATE_INSIGHTS,
+) -> Path:
+    """Write insights incrementally: JSONL shards, Parquet row groups and a manifest.
+
+    Output goes to ``streaming/`` under the export dir so it never mixes with
+    the batch summaries. The export is built in a hidden staging directory and
+    only swapped in once complete, so a failed run leaves the previous
+    manifest and the shards it points at untouched. At most one shard's worth
+    of stat rows is held in memory; each shard's rows become one row group in
+    the regime/pair Parquet files, and the manifest records that row group per
+    insight.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Streaming export requires pyarrow to write Parquet.") from exc
+
+    regime_schema = pa.schema(
+        [
+            ("regime", pa.string()),
+            ("mean", pa.float64()),
+            ("median", pa.float64()),
+            ("n_valid", pa.int64()),
+            ("n_missing", pa.int64()),
+            ("insight_id", pa.string()),
+            ("kpi", pa.string()),
+        ]
+    )
+    pair_schema = pa.schema(
+        [
+            ("base_regime", pa.string()),
+            ("compare_regime", pa.string()),
+            ("delta_mean", pa.float64()),
+            ("ratio_mean", pa.float64()),
+            ("insight_id", pa.string()),
+            ("kpi", pa.string()),
+        ]
+    )
+
+    data_root = export_dir.parent.parent
+    stream_dir = export_dir / STREAMING_SUBDIR
+    staging_dir = Path(tempfile.mkdtemp(prefix=f".{STREAMING_SUBDIR}-", dir=export_dir))
+    staging_dir.chmod(0o755)
+    windows = regime_windows(df)
+    regime_path = staging_dir / "insight_regime_stats.parquet"
+    pair_path = staging_dir / "insight_pair_deltas.parquet"
+    markdown_path = staging_dir / "insight_validation_summary.md"
+
+    try:
+        with InsightShardWriter(
+            staging_dir / "insights", staging_dir, records_per_shard
+        ) as shards, pq.ParquetWriter(
+            regime_path, regime_schema
+        ) as regime_writer, pq.ParquetWriter(
+            pair_path, pair_schema
+        ) as pair_writer, markdown_path.open(
+            "w", encoding="utf-8"
+        ) as markdown:
+            regime_groups = RowGroupBuffer(
+                regime_writer, lambda rows: pa.Table.from_pylist(rows, schema=regime_schema)
+            )
+            pair_groups = RowGroupBuffer(
+                pair_writer, lambda rows: pa.Table.from_pylist(rows, schema=pair_schema)
+            )
+            markdown.write("\n".join(markdown_header(export_dir, data_path, windows)) + "\n")
+            for record, regime_rows, pair_rows in iter_insight_records(
+                df, candidates, export_dir, fig_dir
+            ):
+                if shards.shard_index != len(shards.shards) - 1:
+                    # The record opens a new shard: close out the previous row groups.
+                    regime_groups.flush()
+                    pair_groups.flush()
+                entry = shards.write(record)
+                entry["regime_row_group"] = regime_groups.add(regime_rows)
+                entry["pair_row_group"] = pair_groups.add(pair_rows)
+                markdown.write("\n".join(markdown_insight_section(record)) + "\n")
+            regime_groups.flush()
+            pair_groups.flush()
+
+        manifest = {
+            "source_data": as_relative_posix(data_path, data_root),
+            "export_dir": as_relative_posix(export_dir, data_root),
+            "regime_windows": windows,
+            "records_per_shard": records_per_shard,
+            "shards": shards.shards,
+            "regime_stats": as_relative_posix(regime_path, staging_dir),
+            "pair_deltas": as_relative_posix(pair_path, staging_dir),
+            "insights": shards.index,
+        }
+        (staging_dir / "insight_manifest.json").write_text(
+            json.dumps(manifest, indent=2), encoding="utf-8"
+        )
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    # Swap the finished export in; manifest paths are relative, so they hold.
+    retired_dir = export_dir / f".{STREAMING_SUBDIR}-retired"
+    shutil.rmtree(retired_dir, ignore_errors=True)
+    if stream_dir.exists():
+        stream_dir.rename(retired_dir)
+    staging_dir.rename(stream_dir)
+    shutil.rmtree(retired_dir, ignore_errors=True)
+    return stream_dir / "insight_manifest.json"
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="write JSONL shards, Parquet row groups and a manifest to streaming/ "
+        "instead of the monolithic JSON/CSV summaries",
+    )
+    parser.add_argument(
+        "--records-per-shard",
+        type=int,
+        default=DEFAULT_RECORDS_PER_SHARD,
+        help="maximum insight records per JSONL shard in streaming mode",
+    )
+    parser.add_argument(
+        "--generate",
+        action="store_true",
+        help="sweep KPI x regime pair x segment candidates instead of using "
+        "the hand-written CANDIDATE_INSIGHTS",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=DEFAULT_TOP_K,
+        help="number of generated candidates to chart and export",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=DEFAULT_TIME_BUDGET_S,
+        help="seconds allowed for the candidate sweep before keeping the partial top-k",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=DEFAULT_ALPHA,
+        help="family-wise significance level for generated candidates (Bonferroni "
+        "over the whole sweep)",
+    )
+    args = parser.parse_args(argv)
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+    if args.records_per_shard < 1:
+        parser.error("--records-per-shard must be at least 1")
+    if args.time_budget <= 0:
+        parser.error("--time-budget must be positive")
+    if not 0 < args.alpha < 1:
+        parser.error("--alpha must be between 0 and 1")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    start_dir = Path(__file__).resolve().parent if "__file__" in globals() else Path.cwd()
+    data_path = locate_data_clean(start_dir)
+    df = load_frame(data_path)
+    export_dir, fig_dir = ensure_output_dirs(data_path)
+
+    if args.generate:
+        candidates, sweep = generate_candidate_insights(
+            df, top_k=args.top_k, time_budget_s=args.time_budget, alpha=args.alpha
+        )
+        print(
+            f"Candidate sweep: {sweep['kpis']} KPIs x {sweep['regime_pairs']} regime pairs, "
+            f"{sweep['tests']} tests, "
+            f"{sweep['slices_evaluated']}/{sweep['slices']} segment slices evaluated, "
+            f"{sweep['kept']} kept in {sweep['elapsed_s']:.2f}s"
+        )
+        if sweep["budget_exhausted"]:
+            print(f"WARNING: candidate sweep hit the {args.time_budget:.1f}s budget; top-k is partial")
+        if not candidates:
+            raise SystemExit(
+                "Candidate sweep kept no insights; nothing exported. "
+                "Raise --time-budget or --alpha."
+            )
+        # Generated figures live apart from the hand-written ones and are
+        # rebuilt from scratch so earlier refreshes leave no orphans behind.
+        fig_dir = fig_dir / "generated"
+        shutil.rmtree(fig_dir, ignore_errors=True)
+        fig_dir.mkdir(parents=True)
+    else:
+        candidates = CANDIDATE_INSIGHTS
+
+    if args.streaming:
+        manifest_path = export_streaming(
+            df, data_path, export_dir, fig_dir, args.records_per_shard, candidates
+        )
+        print(f"Saved streaming artifacts to {manifest_path.parent} (manifest: {manifest_path.name})")
+    else:
+        export_batch(df, data_path, export_dir, fig_dir, candidates)
+        print(f"Saved LLM-ready artifacts to {export_dir}")
 
 
 if __name__ == "__main__":